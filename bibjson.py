@@ -1,7 +1,5 @@
-import sys
 import logging
-
-from collections import OrderedDict
+import unicodedata
 
 import bibtexparser
 from bibtexparser.bparser import BibTexParser
@@ -9,425 +7,318 @@ from bibtexparser import customization as bib_custom
 
 
 CONVERT_TO_UNICODE = True
+VALIDATE_REQUIRED_KEYS = True
+
+
+# data keys that are copied as-is from the bibtex entry to the BibJSON record, per entry type
+_ARTICLE_KEYS = ('title', 'year', 'note', 'key')
+_BOOK_KEYS = ('title', 'year', 'note', 'key', 'volume', 'number', 'series', 'edition', 'month')
+_BOOKLET_KEYS = ('title', 'howpublished', 'address', 'month', 'year', 'note', 'key')
+_ELECTRONIC_KEYS = ('title', 'howpublished', 'month', 'year', 'note', 'key')
+_INBOOK_KEYS = ('title', 'year', 'note', 'key', 'volume', 'number', 'series', 'edition', 'month')
+_INCOLLECTION_KEYS = ('title', 'year', 'booktitle', 'note', 'key', 'volume', 'number', 'series', 'chapter', 'pages',
+                      'address', 'edition', 'month')
+_INPROCEEDINGS_KEYS = ('title', 'year', 'booktitle', 'note', 'key', 'volume', 'number', 'series', 'organization',
+                       'pages', 'address', 'edition', 'month')
+_MANUAL_KEYS = ('title', 'address', 'organization', 'edition', 'month', 'year', 'note', 'key')
+_MISC_KEYS = ('title', 'howpublished', 'month', 'year', 'note', 'key')
+_PERIODICAL_KEYS = ('title', 'year', 'number', 'organization', 'note', 'key')
+_PHDTHESIS_KEYS = ('title', 'school', 'year', 'address', 'month', 'note', 'key')
+_PROCEEDINGS_KEYS = ('title', 'year', 'volume', 'number', 'series', 'address', 'month', 'organization', 'note', 'key')
+_TECHREPORT_KEYS = ('title', 'institution', 'year', 'number', 'address', 'month', 'note', 'key')
+_UNPUBLISHED_KEYS = ('title', 'note', 'month', 'year', 'key')
 
 
 def collection_from_bibtex_str(bib_str, **kwargs):
     """
     Transform a Bibtex string (e.g. from a .bib-file) to a BibJSON collection.
     :param bib_str: input bibtex string
-    :param kwargs: metadata for the BibJSON collection. "collection" parameter must be set.
+    :param kwargs: metadata for the BibJSON collection. "collection" parameter must be set. Pass validate=False
+                   to skip checking entries for required keys.
     :return BibJSON collection dictionary
     """
-    bib_parser = BibTexParser()
-    bib_parser.ignore_nonstandard_types = False     # this is flipped. this seems to be an error in the library
-    bib_parser.customization = _parse_bib_entry
+    return collection_from_dict(entries_from_bibtex_str(bib_str), **kwargs)
+
+
+def entries_from_bibtex_str(bib_str):
+    """
+    Parse a Bibtex string (e.g. from a .bib-file) to a dictionary of bibtex entries using bibtexparser.
+    :param bib_str: input bibtex string
+    :return dictionary that maps entry keys to bibtex entries
+    """
+    bib_obj = bibtexparser.loads(bib_str, parser=_make_bib_parser())
 
-    bib_obj = bibtexparser.loads(bib_str, parser=bib_parser)
+    return _entries_by_key(bib_obj.entries)
 
-    return collection_from_dict(bib_obj.entries_dict, **kwargs)
+
+def entries_from_bibtex_file(bib_file):
+    """
+    Parse an opened .bib-file to a dictionary of bibtex entries using bibtexparser.
+    :param bib_file: input bibtex file object
+    :return dictionary that maps entry keys to bibtex entries
+    """
+    bib_obj = bibtexparser.load(bib_file, parser=_make_bib_parser())
+
+    return _entries_by_key(bib_obj.entries)
 
 
 def collection_from_dict(entries, **kwargs):
     """
-    Create collection from a dictionary of bibtex entries from bibtexparser.
-    :param entries: bibtex entries from bibtexparser.
-    :param kwargs: metadata for the BibJSON collection. "collection" parameter must be set.
+    Create collection from a list or a dictionary of bibtex entries from bibtexparser.
+    :param entries: bibtex entries from bibtexparser. Either a list of entries or a dictionary that maps
+                    entry keys to entries.
+    :param kwargs: metadata for the BibJSON collection. "collection" parameter must be set. Pass validate=False
+                   to skip checking entries for required keys.
     :return BibJSON collection dictionary
     """
-    c = OrderedDict()
-    c['metadata'] = OrderedDict()
+    c = {}
+    c['metadata'] = {}
     c['records'] = []
 
     # set metadata from kwargs
     assert 'collection' in kwargs
     for k, v in kwargs.items():
-        if k != 'ignore_exceptions':
+        if k not in ('ignore_exceptions', 'validate'):
             c['metadata'][k] = v
 
     # set records
-    for key, entry in entries.items():
-        c['records'].append(record_from_entry(key, entry, kwargs['collection']))
+    records = iter_records_from_dict(entries, kwargs['collection'], validate=kwargs.get('validate'))
+    c['records'] = [r for _, r in records]
 
     c['metadata']['records'] = len(c['records'])
 
     return c
 
 
-def record_from_entry(key, entry, collection):
+def iter_records_from_dict(entries, collection, validate=None):
+    """
+    Generate BibJSON records one by one from a list or a dictionary of bibtex entries from bibtexparser. Use this
+    instead of collection_from_dict in order to process large collections without keeping all records in memory.
+    :param entries: bibtex entries from bibtexparser. Either a list of entries or a dictionary that maps
+                    entry keys to entries.
+    :param collection: collection name
+    :param validate: check entries for required keys. If None, use VALIDATE_REQUIRED_KEYS.
+    :return generator of (key, BibJSON record) tuples
+    """
+    if validate is None:
+        validate = VALIDATE_REQUIRED_KEYS
+
+    for key, entry in _entry_items(entries):
+        yield key, record_from_entry(key, entry, collection, validate)
+
+
+def record_from_entry(key, entry, collection, validate=None):
     """
     Create a single BibJSON record from a BibTeX entry dictionary.
     :param key: entry key (citekey)
     :param entry: BibTeX entry dictionary
     :param collection: collection name
+    :param validate: check entry for required keys. If None, use VALIDATE_REQUIRED_KEYS.
     :return BibJSON record
     """
+    if validate is None:
+        validate = VALIDATE_REQUIRED_KEYS
+
     # create new record
-    r = OrderedDict()
+    r = {}
     r['type'] = entry['ENTRYTYPE']
     r['id'] = key
     r['citekey'] = key
     r['collection'] = collection
 
     # call fill_record_<type> to convert entry of specific type to BibJSON dict
-    fill_func = 'fill_record_%s' % r['type']
-    call_fn = getattr(sys.modules[__name__], fill_func, None)
+    call_fn = _FILL_DISPATCH.get(r['type'])
     if call_fn:
-        call_fn(r, entry)
+        call_fn(r, entry, validate)
     else:
-        logging.error("entry '%s': no conversion function for record type '%s'" % (key, r['type']))
+        logging.error("entry '%s': no conversion function for record type '%s'", key, r['type'])
 
     return r
 
 
-def fill_record_article(r, entry):
-    """
-    handle 'article' type
-    :param r: BibJSON record dict that will be filled
-    :param entry: bibtexparser entry that will be used to fill the BibJSON record
-    :return None
-    """
-    _require_keys_in_entry(entry, ('title', 'year', 'author', 'journal'), req_all=True)
-
-    _simple_fill(r, entry, ('title', 'year', 'note', 'key'))
-
-    _fill_author(r, entry)
-    _fill_journal(r, entry)
-
-
-def fill_record_book(r, entry):
-    """
-    handle 'book' type
-    :param r: BibJSON record dict that will be filled
-    :param entry: bibtexparser entry that will be used to fill the BibJSON record
-    :return None
-    """
-    _require_keys_in_entry(entry, ('title', 'year', 'publisher'), req_all=True)
-    _require_keys_in_entry(entry, ('author', 'editor'), req_all=False)
-
-    _simple_fill(r, entry, ('title', 'year', 'note', 'key', 'volume', 'number', 'series', 'edition', 'month'))
-
-    _fill_author(r, entry)
-    _fill_editor(r, entry)
-    _fill_publisher(r, entry)
-
-
-def fill_record_booklet(r, entry):
-    """
-    handle 'booklet' type
-    :param r: BibJSON record dict that will be filled
-    :param entry: bibtexparser entry that will be used to fill the BibJSON record
-    :return None
-    """
-    _require_keys_in_entry(entry, ('title', ), req_all=True)
-    _simple_fill(r, entry, ('title', 'howpublished', 'address', 'month', 'year', 'note', 'key'))
-
-    _fill_author(r, entry)
-
-
-def fill_record_conference(r, entry):
-    """
-    handle 'conference' type
-    :param r: BibJSON record dict that will be filled
-    :param entry: bibtexparser entry that will be used to fill the BibJSON record
-    :return None
-    """
-    fill_record_inproceedings(r, entry)
-
-
-def fill_record_electronic(r, entry):
-    """
-    handle 'electronic' type
-    :param r: BibJSON record dict that will be filled
-    :param entry: bibtexparser entry that will be used to fill the BibJSON record
-    :return None
-    """
-    _require_keys_in_entry(entry, ('author', 'title', 'howpublished'), req_all=True)
-
-    _simple_fill(r, entry, ('title', 'howpublished', 'month', 'year', 'note', 'key'))
-
-    _fill_author(r, entry)
-
-
-def fill_record_inbook(r, entry):
-    """
-    handle 'inbook' type
-    :param r: BibJSON record dict that will be filled
-    :param entry: bibtexparser entry that will be used to fill the BibJSON record
-    :return None
-    """
-    _require_keys_in_entry(entry, ('author', 'editor'), req_all=False)
-    _require_keys_in_entry(entry, ('title', 'year', 'publisher'), req_all=True)
-
-    _simple_fill(r, entry, ('title', 'year', 'note', 'key', 'volume', 'number', 'series', 'edition', 'month'))
-
-    _simple_fill_one_of(r, entry, ('chapter', 'pages'))
-
-    _fill_author(r, entry)
-    _fill_editor(r, entry)
-    _fill_publisher(r, entry)
-
-
-def fill_record_incollection(r, entry):
-    """
-    handle 'incollection' type
-    :param r: BibJSON record dict that will be filled
-    :param entry: bibtexparser entry that will be used to fill the BibJSON record
-    :return None
-    """
-    _require_keys_in_entry(entry, ('author', 'publisher', 'title', 'year', 'booktitle'), req_all=True)
-
-    _simple_fill(r, entry, ('title', 'year', 'booktitle', 'note', 'key', 'volume', 'number', 'series', 'chapter',
-                 'pages', 'address', 'edition', 'month'))
-
-    _fill_author(r, entry)
-    _fill_publisher(r, entry)
-    _fill_editor(r, entry)
-
-
-def fill_record_inproceedings(r, entry):
-    """
-    handle 'inproceedings' type
-    :param r: BibJSON record dict that will be filled
-    :param entry: bibtexparser entry that will be used to fill the BibJSON record
-    :return None
-    """
-    _require_keys_in_entry(entry, ('author', 'title', 'year', 'booktitle'), req_all=True)
-
-    _simple_fill(r, entry, ('title', 'year', 'booktitle', 'note', 'key', 'volume', 'number', 'series', 'organization',
-                 'pages', 'address', 'edition', 'month'))
-
-    _fill_author(r, entry)
-    _fill_editor(r, entry)
-    _fill_publisher(r, entry)
-
-
-def fill_record_manual(r, entry):
-    """
-    handle 'manual' type
-    :param r: BibJSON record dict that will be filled
-    :param entry: bibtexparser entry that will be used to fill the BibJSON record
-    :return None
-    """
-    _require_keys_in_entry(entry, ('author', 'title'), req_all=True)
-    _simple_fill(r, entry, ('title', 'address', 'organization', 'edition', 'month', 'year', 'note', 'key'))
-
-    _fill_author(r, entry)
-
-
-def fill_record_mastersthesis(r, entry):
-    """
-    handle 'mastersthesis' type
-    :param r: BibJSON record dict that will be filled
-    :param entry: bibtexparser entry that will be used to fill the BibJSON record
-    :return None
-    """
-    fill_record_phdthesis(r, entry)
-
-
-def fill_record_misc(r, entry):
-    """
-    handle 'misc' type
-    :param r: BibJSON record dict that will be filled
-    :param entry: bibtexparser entry that will be used to fill the BibJSON record
-    :return None
-    """
-    _simple_fill(r, entry, ('title', 'howpublished', 'month', 'year', 'note', 'key'))
-
-    _fill_author(r, entry)
-
-
-def fill_record_periodical(r, entry):
-    """
-    handle 'periodical' type
-    :param r: BibJSON record dict that will be filled
-    :param entry: bibtexparser entry that will be used to fill the BibJSON record
-    :return None
-    """
-    _require_keys_in_entry(entry, ('title', 'year', 'number'), req_all=True)
-
-    _simple_fill(r, entry, ('title', 'year', 'number', 'organization', 'note', 'key'))
-
-    _fill_author(r, entry)
-    _fill_publisher(r, entry)
-    _fill_journal(r, entry)
-
-
-def fill_record_phdthesis(r, entry):
-    """
-    handle 'phdthesis' type
-    :param r: BibJSON record dict that will be filled
-    :param entry: bibtexparser entry that will be used to fill the BibJSON record
-    :return None
-    """
-    _require_keys_in_entry(entry, ('author', 'title', 'school', 'year'), req_all=True)
-
-    _simple_fill(r, entry, ('title', 'school', 'year', 'address', 'month', 'note', 'key'))
-
-    _fill_author(r, entry)
-
-
-def fill_record_proceedings(r, entry):
-    """
-    handle 'proceedings' type
-    :param r: BibJSON record dict that will be filled
-    :param entry: bibtexparser entry that will be used to fill the BibJSON record
-    :return None
-    """
-    _require_keys_in_entry(entry, ('title', 'year'), req_all=True)
-    _simple_fill(r, entry, ('title', 'year', 'volume', 'number', 'series', 'address', 'month', 'organization',
-                 'note', 'key'))
-
-    _fill_editor(r, entry)
-    _fill_publisher(r, entry)
-
-
-def fill_record_techreport(r, entry):
-    """
-    handle 'techreport' type
-    :param r: BibJSON record dict that will be filled
-    :param entry: bibtexparser entry that will be used to fill the BibJSON record
-    :return None
-    """
-    _require_keys_in_entry(entry, ('author', 'title', 'institution', 'year'), req_all=True)
-
-    _simple_fill(r, entry, ('title', 'institution', 'year', 'number', 'address', 'month', 'note', 'key'))
-
-    _fill_author(r, entry)
-    _fill_editor(r, entry)
-
-
-def fill_record_unpublished(r, entry):
-    """
-    handle 'unpublished' type
-    :param r: BibJSON record dict that will be filled
-    :param entry: bibtexparser entry that will be used to fill the BibJSON record
-    :return None
-    """
-    _require_keys_in_entry(entry, ('author', 'title', 'note'), req_all=True)
-
-    _simple_fill(r, entry, ('title', 'note' 'month', 'year', 'key'))
-
-    _fill_author(r, entry)
-
-
-def _simple_fill(r, entry, keys):
-    """
-    For each key in keys that exists in <entry>, assign its data to the record <r>
-    :param r: BibJSON record dict that will be filled
-    :param entry: bibtexparser entry that will be used to fill the BibJSON record
-    :param keys: data keys to use
-    :return None
-    """
-    for k in keys:
-        if k in entry:
-            r[k] = entry[k]
-
-
-def _simple_fill_one_of(r, entry, keys):
-    """
-    Do _simple_fill but require that at least one of the keys in <keys> exists in entry.
+def _entry_items(entries):
+    """
+    Iterate through (key, entry) tuples of bibtex entries.
+    :param entries: list of bibtex entries or dictionary that maps entry keys to entries
+    :return iterable of (key, entry) tuples
+    """
+    if not isinstance(entries, dict):
+        entries = _entries_by_key(entries)
+
+    return entries.items()
+
+
+def _entries_by_key(entries):
+    """
+    Map entry keys to bibtex entries. Like bibtexparser's entries_dict, the last entry is used if a key occurs
+    more than once, but each duplicate key is reported via logging.error().
+    :param entries: list of bibtex entries
+    :return dictionary that maps entry keys to entries
+    """
+    entries_by_key = {}
+    for e in entries:
+        key = e['ID']
+        if key in entries_by_key:
+            logging.error("entry '%s': duplicate entry key, only the last entry with this key is used", key)
+        entries_by_key[key] = e
+
+    return entries_by_key
+
+
+# conversion rules per entry type as tuples of:
+# (required keys as (keys, req_all) tuples, keys that are copied as-is, keys of which at least one must exist and
+#  which are copied as-is, structured fields "author", "editor", "publisher" or "journal" in output order)
+_FILL_SPECS = {
+    'article': (((('title', 'year', 'author', 'journal'), True), ),
+                _ARTICLE_KEYS, None, ('author', 'journal')),
+    'book': (((('title', 'year', 'publisher'), True), (('author', 'editor'), False)),
+             _BOOK_KEYS, None, ('author', 'editor', 'publisher')),
+    'booklet': (((('title', ), True), ),
+                _BOOKLET_KEYS, None, ('author', )),
+    'electronic': (((('author', 'title', 'howpublished'), True), ),
+                   _ELECTRONIC_KEYS, None, ('author', )),
+    'inbook': (((('author', 'editor'), False), (('title', 'year', 'publisher'), True)),
+               _INBOOK_KEYS, ('chapter', 'pages'), ('author', 'editor', 'publisher')),
+    'incollection': (((('author', 'publisher', 'title', 'year', 'booktitle'), True), ),
+                     _INCOLLECTION_KEYS, None, ('author', 'publisher', 'editor')),
+    'inproceedings': (((('author', 'title', 'year', 'booktitle'), True), ),
+                      _INPROCEEDINGS_KEYS, None, ('author', 'editor', 'publisher')),
+    'manual': (((('author', 'title'), True), ),
+               _MANUAL_KEYS, None, ('author', )),
+    'misc': ((),
+             _MISC_KEYS, None, ('author', )),
+    'periodical': (((('title', 'year', 'number'), True), ),
+                   _PERIODICAL_KEYS, None, ('author', 'publisher', 'journal')),
+    'phdthesis': (((('author', 'title', 'school', 'year'), True), ),
+                  _PHDTHESIS_KEYS, None, ('author', )),
+    'proceedings': (((('title', 'year'), True), ),
+                    _PROCEEDINGS_KEYS, None, ('editor', 'publisher')),
+    'techreport': (((('author', 'title', 'institution', 'year'), True), ),
+                   _TECHREPORT_KEYS, None, ('author', 'editor')),
+    'unpublished': (((('author', 'title', 'note'), True), ),
+                    _UNPUBLISHED_KEYS, None, ('author', )),
+}
+_FILL_SPECS['conference'] = _FILL_SPECS['inproceedings']
+_FILL_SPECS['mastersthesis'] = _FILL_SPECS['phdthesis']
+
+
+def _mk_name(n):
+    """
+    Make a "named entry" dict for name <n>
+    :param n: name
+    :return dict with the name
+    """
+    return {'name': n}
+
+
+def _make_fill_fn(rtype, required, simple_keys, one_of_keys, fields):
+    """
+    Generate a fill_record_<rtype> function for the conversion rules of an entry type. All key checks are inlined
+    into the generated source so that filling a record does not need any further function calls.
+    :param rtype: entry type
+    :param required: required keys as (keys, req_all) tuples
+    :param simple_keys: keys that are copied as-is
+    :param one_of_keys: keys of which at least one must exist and which are copied as-is or None
+    :param fields: structured fields "author", "editor", "publisher" or "journal" in output order
+    :return function with signature (r, entry, validate=None) that fills the BibJSON record r from the bibtexparser
+            entry and checks for required keys if validate is True (or None and VALIDATE_REQUIRED_KEYS is True)
+    """
+    def require(keys, req_all):
+        cond = (' and ' if req_all else ' or ').join('%r in entry' % k for k in keys)
+        return ['    if validate and not (%s):' % cond,
+                '        _require_keys_in_entry(entry, %r, req_all=%r)' % (keys, req_all)]
+
+    def copy(k, indent='    ', target='r'):
+        return ['%sif %r in entry:' % (indent, k),
+                '%s    %s[%r] = entry[%r]' % (indent, target, k, k)]
+
+    fn_name = 'fill_record_%s' % rtype
+    # bind globals that are used for name lists as default arguments so that they are accessed as fast locals
+    if 'author' in fields or 'editor' in fields:
+        src = ['def %s(r, entry, validate=None, _list=list, _map=map, _mk_name=_mk_name):' % fn_name]
+    else:
+        src = ['def %s(r, entry, validate=None):' % fn_name]
+
+    if required or one_of_keys:
+        src.extend(['    if validate is None:',
+                    '        validate = VALIDATE_REQUIRED_KEYS'])
+
+    for keys, req_all in required:
+        src.extend(require(keys, req_all))
+
+    for k in simple_keys:
+        src.extend(copy(k))
+
+    if one_of_keys:
+        src.extend(require(one_of_keys, False))
+        for k in one_of_keys:
+            src.extend(copy(k))
+
+    for field in fields:
+        if field in ('author', 'editor'):
+            src.extend(['    if %r in entry:' % field,
+                        '        r[%r] = _list(_map(_mk_name, entry[%r]))' % (field, field)])
+        elif field == 'publisher':
+            src.extend(["    if 'publisher' in entry:",
+                        "        r['publisher'] = publisher = {'name': entry['publisher']}"])
+            src.extend(copy('address', indent='        ', target='publisher'))
+        elif field == 'journal':
+            src.extend(["    if 'journal' in entry and 'volume' in entry:",
+                        "        r['journal'] = journal = {'name': entry['journal'], 'volume': entry['volume']}"])
+            for k in ('number', 'pages', 'month'):
+                src.extend(copy(k, indent='        ', target='journal'))
+        else:
+            raise ValueError("unknown field '%s' for record type '%s'" % (field, rtype))
+
+    ns = {}
+    exec(compile('\n'.join(src), '<%s>' % fn_name, 'exec'), globals(), ns)
+    fn = ns[fn_name]
+    fn.__doc__ = """
+    handle '%s' type
     :param r: BibJSON record dict that will be filled
     :param entry: bibtexparser entry that will be used to fill the BibJSON record
-    :param keys: data keys to use
+    :param validate: check entry for required keys. If None, use VALIDATE_REQUIRED_KEYS.
     :return None
-    """
-    _require_keys_in_entry(entry, keys, req_all=False)
+    """ % rtype
 
-    for k in keys:
-        if k in entry:
-            r[k] = entry[k]
+    return fn
 
 
-def _fill_author(r, entry):
-    """
-    Make a "named entry" dict with an author field
-    :param r: BibJSON record dict that will be filled
-    :param entry: bibtexparser entry that will be used to fill the BibJSON record
-    :return None
-    """
-    if 'author' not in entry:
-        return
-
-    _fill_named_entry(r, entry, 'author')
+# map each entry type to its generated fill_record_<type> function and also provide these functions on module level
+_FILL_DISPATCH = {rtype: _make_fill_fn(rtype, *spec) for rtype, spec in _FILL_SPECS.items()}
+globals().update(('fill_record_%s' % rtype, fn) for rtype, fn in _FILL_DISPATCH.items())
 
 
-def _fill_editor(r, entry):
-    """
-    Make a "named entry" dict with an editor field
-    :param r: BibJSON record dict that will be filled
-    :param entry: bibtexparser entry that will be used to fill the BibJSON record
-    :return None
-    """
-    if 'editor' not in entry:
-        return
-
-    _fill_named_entry(r, entry, 'editor')
-
-
-def _fill_publisher(r, entry):
+def _require_keys_in_entry(entry, keys, req_all):
     """
-    Make a "named entry" dict with a publisher field
-    :param r: BibJSON record dict that will be filled
+    Require at least one or all keys in <keys> to be found in <entry>. If not, call logging.error().
     :param entry: bibtexparser entry that will be used to fill the BibJSON record
+    :param keys: keys to check
+    :param req_all: True: require all keys to be in <entry>, False: require at least one key to be in <entry>
     :return None
     """
-    if 'publisher' not in entry:
-        return
-
-    r['publisher'] = {
-        'name': entry['publisher']
-    }
-
-    if 'address' in entry:
-        r['publisher']['address'] = entry['address']
-
+    if req_all:
+        found = all(k in entry for k in keys)
+    else:
+        found = any(k in entry for k in keys)
 
-def _fill_named_entry(r, entry, k):
-    """
-    Make a "named entry" dict with the name from the field with key <k>
-    :param r: BibJSON record dict that will be filled
-    :param entry: bibtexparser entry that will be used to fill the BibJSON record
-    :param k: field to use for the name
-    :return None
-    """
-    r[k] = [{'name': n} for n in entry[k]]
+    if not found:
+        logging.error("entry '%s': %s of the required keys '%s' not found in record",
+                      entry.get('ID'), 'All' if not req_all else 'At least one', ', '.join(keys))
 
 
-def _fill_journal(r, entry):
+def _make_bib_parser():
     """
-    Make a "journal" dict
-    :param r: BibJSON record dict that will be filled
-    :param entry: bibtexparser entry that will be used to fill the BibJSON record
-    :return None
+    Create a bibtexparser parser that applies _parse_bib_entry to each entry.
+    A new parser must be created for each input because BibTexParser is not reusable: it collects all parsed
+    entries and @string definitions in a single BibDatabase which is bound to its grammar on construction.
+    :return BibTexParser instance
     """
-    if 'journal' not in entry or 'volume' not in entry:
-        return
-
-    # fill with required fields
-    r['journal'] = {
-        'name': entry['journal'],
-        'volume': entry['volume']
-    }
+    bib_parser = BibTexParser()
+    bib_parser.ignore_nonstandard_types = False     # this is flipped. this seems to be an error in the library
+    bib_parser.customization = _parse_bib_entry
 
-    # fill optional fields
-    opt_keys = ('number', 'pages', 'month')
-    for k in opt_keys:
-        if k in entry:
-            r['journal'][k] = entry[k]
-
-
-def _require_keys_in_entry(entry, keys, req_all):
-    """
-    Require at least one or all keys in <keys> to be found in <entry>. If not, call logging.error().
-    :param entry: bibtexparser entry that will be used to fill the BibJSON record
-    :param keys: keys to check
-    :param req_all: True: require all keys to be in <entry>, False: require at least one key to be in <entry>
-    :return None
-    """
-    keys_in_entry = [k in entry for k in keys]
-    if (req_all and not all(keys_in_entry)) or (not req_all and not any(keys_in_entry)):
-        logging.error("entry '%s': %s of the required keys '%s' not found in record"
-                      % (entry.get('ID'), 'All' if not req_all else 'At least one', ', '.join(keys)))
+    return bib_parser
 
 
 def _parse_bib_entry(entry):
@@ -436,7 +327,7 @@ def _parse_bib_entry(entry):
     :param entry: bibtex record to modify
     :return bibtex record
     """
-    if CONVERT_TO_UNICODE:
+    if CONVERT_TO_UNICODE and _needs_unicode_conversion(entry):
         entry = bib_custom.convert_to_unicode(entry)
 
     entry = bib_custom.author(entry)
@@ -445,3 +336,18 @@ def _parse_bib_entry(entry):
     entry = bib_custom.page_double_hyphen(entry)
 
     return entry
+
+
+def _needs_unicode_conversion(entry):
+    """
+    Check if bib_custom.convert_to_unicode would change anything in <entry>, i.e. if any field value contains
+    LaTeX escapes or braces or is not NFC normalized.
+    :param entry: bibtex record to check
+    :return True if conversion is necessary, else False
+    """
+    for v in entry.values():
+        if not isinstance(v, str) or '\\' in v or '{' in v or '}' in v \
+                or not unicodedata.is_normalized('NFC', v):
+            return True
+
+    return False
@@ -8,13 +8,19 @@ import sys
 import bibjson
 import os
 import json
-from datetime import datetime
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 def main():
     """
     Script main function: Read arguments, produce BibJSON output.
     """
+    from datetime import datetime, timezone
+
     if len(sys.argv) < 2:
         print("will output BibJSON to stdout", file=sys.stderr)
         print("usage: %s <bibtex-file>" % sys.argv[0], file=sys.stderr)
@@ -26,17 +32,44 @@ def main():
     collection = os.path.splitext(os.path.basename(bibtex_file))[0]
 
     # read the bibtex file
-    with open(bibtex_file) as f:
-        bibtex_str = f.read()
+    with open(bibtex_file, 'r', encoding='utf-8', buffering=1 << 20) as f:
+        entries = bibjson.entries_from_bibtex_file(f)
+
+    metadata = {
+        'collection': collection,
+        'source': bibtex_file,
+        'created': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'records': len(entries),
+    }
+
+    # stream the BibJSON collection to stdout record by record with nice indentation, so that the whole
+    # collection never needs to be held in memory
+    out = sys.stdout.buffer
+    out.write(b'{\n  "metadata": ')
+    out.write(_indent_json(metadata, 1))
+    out.write(b',\n  "records": [')
+
+    n_written = 0
+    for _, record in bibjson.iter_records_from_dict(entries, collection):
+        out.write(b',\n    ' if n_written else b'\n    ')
+        out.write(_indent_json(record, 2))
+        n_written += 1
 
-        # create BibJSON collection from file
-        bibjson_collection = bibjson.collection_from_bibtex_str(bibtex_str,
-                                                                collection=collection,
-                                                                source=bibtex_file,
-                                                                created=datetime.utcnow().isoformat())
+    out.write(b'\n  ]\n}' if n_written else b']\n}')
+    out.flush()
+
+
+def _indent_json(obj, level):
+    """
+    Serialize <obj> to UTF-8 encoded JSON with an indentation of 2 spaces that can be embedded at nesting level
+    <level> of the output document. Uses orjson if it is installed.
+    """
+    if orjson:
+        s = orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    else:
+        s = json.dumps(obj, indent=2, separators=(',', ': '), ensure_ascii=False).encode('utf-8')
 
-        # print it to stdout with nice indentation
-        json.dump(bibjson_collection, sys.stdout, indent=True)
+    return s.replace(b'\n', b'\n' + b'  ' * level)
 
 
 if __name__ == '__main__':